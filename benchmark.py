@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+from math import sin
+from typing import Callable
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame as pg
+
+from kit import GameConfig, GameManager
+from tile_map import Sprite, SpriteGroup, TileMapNode
+from resources import Resources
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+STAGES = "step", "update_sprites", "update_tiles", "update_chunks", "composite"
+
+
+class Workload:
+    name: str
+    frame: int
+    node: TileMapNode
+    sprites: list[Sprite]
+    world_size: int
+
+    def __init__(self, node: TileMapNode, sprites: int) -> None:
+        self.frame = 0
+        self.node = node
+        self.world_size = self.get_world_size(sprites)
+
+        self.sprites = [self.create_sprite() for _ in range(sprites)]
+        self.node.add_sprites(self.sprites)
+
+    def get_world_size(self, sprites: int) -> int:
+        return int((sprites * 100) ** 0.5)
+
+    def create_sprite(self) -> Sprite:
+        return Sprite(
+            "tree-0",
+            position=(
+                random.randint(0, self.world_size),
+                random.randint(32, self.world_size + 32)
+            )
+        )
+
+    def step(self) -> None:
+        self.frame += 1
+
+
+class StaticWorkload(Workload):
+    name = "static"
+
+
+class SwayWorkload(Workload):
+    name = "sway"
+
+    def step(self) -> None:
+        super().step()
+
+        for i, sprite in enumerate(self.sprites):
+            sprite.rotation = int(sin((self.frame + i % 30) / (20 + i % 20)) * 2)
+
+
+class BatchSwayWorkload(Workload):
+    name = "batch-sway"
+
+    sprite_group: SpriteGroup
+    phases: np.ndarray
+    speeds: np.ndarray
+
+    def __init__(self, node: TileMapNode, sprites: int) -> None:
+        super().__init__(node, sprites)
+
+        indices = np.arange(sprites)
+
+        self.sprite_group = SpriteGroup(self.sprites)
+        self.phases = indices % 30
+        self.speeds = 20 + indices % 20
+
+    def step(self) -> None:
+        super().step()
+
+        self.node.tile_map.transform_sprites(
+            self.sprite_group,
+            rotations=np.trunc(np.sin((self.frame + self.phases) / self.speeds) * 2)
+        )
+
+
+class CameraWorkload(Workload):
+    name = "camera"
+
+    def get_world_size(self, sprites: int) -> int:
+        return max(super().get_world_size(sprites), 2 * self.node.image.get_width())
+
+    def step(self) -> None:
+        super().step()
+
+        w, h = self.node.image.get_size()
+        span = max(self.world_size - w, 1)
+        x = self.frame * 2 % (span * 2)
+
+        self.node.offset = (x if x < span else span * 2 - x), (self.world_size - h) // 2
+
+
+class SpawnWorkload(Workload):
+    name = "spawn"
+
+    def step(self) -> None:
+        super().step()
+
+        count = max(len(self.sprites) // 20, 1)
+
+        for sprite in random.sample(self.sprites, count):
+            sprite.is_alive = False
+
+        sprites = [self.create_sprite() for _ in range(count)]
+
+        self.sprites = [sprite for sprite in self.sprites if sprite.is_alive] + sprites
+        self.node.add_sprites(sprites)
+
+
+WORKLOADS: dict[str, type[Workload]] = {
+    workload.name: workload
+    for workload in (StaticWorkload, SwayWorkload, BatchSwayWorkload, CameraWorkload, SpawnWorkload)
+    if np is not None or workload is not BatchSwayWorkload
+}
+
+
+def measure(timings: dict[str, list[float]], stage: str, function: Callable, *args) -> None:
+    start = time.perf_counter()
+    function(*args)
+    timings[stage].append((time.perf_counter() - start) * 1000)
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    samples = sorted(samples)
+
+    def percentile(p: float) -> float:
+        return round(samples[min(int(len(samples) * p), len(samples) - 1)], 4)
+
+    return {
+        "mean": round(sum(samples) / len(samples), 4),
+        "p50": percentile(0.5),
+        "p95": percentile(0.95),
+        "max": round(samples[-1], 4)
+    }
+
+
+def run_workload(
+    game: GameManager, workload_type: type[Workload], sprites: int, frames: int, warmup: int
+) -> dict:
+    random.seed(0)
+
+    scene = game.scenes.create_scene(workload_type.name)
+    game.scenes.set_current(workload_type.name)
+
+    node = TileMapNode()
+    scene.root_node.add_nodes([node])
+
+    workload = workload_type(node, sprites)
+    tile_map = node.tile_map
+    size = node.image.get_size()
+    timings: dict[str, list[float]] = {stage: [] for stage in STAGES}
+
+    for frame in range(warmup + frames):
+        if frame == warmup:
+            timings = {stage: [] for stage in STAGES}
+
+        measure(timings, "step", workload.step)
+
+        offset = node.offset
+
+        measure(timings, "update_sprites", node.update_sprites)
+        measure(timings, "update_tiles", tile_map.update_tiles, size, offset)
+        measure(timings, "update_chunks", tile_map.update_chunks)
+        measure(timings, "composite", node.draw, size, (int(offset[0]), int(offset[1])))
+
+    frame_times = [sum(stage_times) for stage_times in zip(*timings.values())]
+
+    return {
+        "sprites": sprites,
+        "frames": frames,
+        "tiles": len(tile_map.tiles),
+        "chunks": len(tile_map.chunks),
+        "memory": tile_map.get_memory_stats(),
+        "frame": summarize(frame_times),
+        "stages": {
+            stage: summarize(stage_times)
+            for stage, stage_times in timings.items()
+        }
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Headless tile map benchmark")
+    parser.add_argument("--sprites", type=int, default=2000)
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--workloads", nargs="+", choices=list(WORKLOADS), default=list(WORKLOADS))
+    parser.add_argument("--output", help="write the JSON report to this path instead of stdout")
+    args = parser.parse_args()
+    output = args.output and os.path.abspath(args.output)
+
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    pg.init()
+
+    config = GameConfig()
+    config.update_fields(screen_size=(512, 288))
+
+    game = GameManager(config)
+    Resources()
+
+    report = {
+        "python": platform.python_version(),
+        "pygame": pg.version.ver,
+        "video_driver": pg.display.get_driver(),
+        "workloads": {
+            name: run_workload(game, WORKLOADS[name], args.sprites, args.frames, args.warmup)
+            for name in args.workloads
+        }
+    }
+
+    if output:
+        with open(output, "w") as file:
+            json.dump(report, file, indent=4)
+    else:
+        json.dump(report, sys.stdout, indent=4)
+        print()
+
+
+if __name__ == "__main__":
+    main()
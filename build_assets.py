@@ -0,0 +1,14 @@
+import pygame as pg
+
+from resources import BUNDLE_PATH, Resources
+
+pg.init()
+
+
+if __name__ == "__main__":
+    pg.display.set_mode((1, 1), pg.HIDDEN)
+
+    resources = Resources(use_bundle=False)
+    resources.prewarm_texture("player-0-0", [0], flip_x=True)
+    resources.prewarm_texture("player-0-1", [0], flip_x=True)
+    resources.save_bundle(BUNDLE_PATH)
@@ -1,10 +1,12 @@
 from .ups_text_component import UpsTextComponent as UpsTextComponent
 from .fps_text_component import FpsTextComponent as FpsTextComponent
+from .frame_timings_text_component import FrameTimingsTextComponent as FrameTimingsTextComponent
 # from .player_movement_component import PlayerMovementComponent as PlayerMovementComponent
 # from .chunk_map_camera_component import ChunkMapCameraComponent as ChunkMapCameraComponent
 
 from .tile_map_statistic_components import (
     TileMapTilesComponent as TileMapTilesComponent,
     TileMapChunksComponent as TileMapChunksComponent,
-    TileMapSpritesComponent as TileMapSpritesComponent
+    TileMapSpritesComponent as TileMapSpritesComponent,
+    TileMapChunkPoolComponent as TileMapChunkPoolComponent
 )
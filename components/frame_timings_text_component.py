@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from kit import Component, GameManager, serialize_field
+
+if TYPE_CHECKING:
+    from nodes import TextNode
+
+
+class FrameTimingsTextComponent(Component):
+    node: TextNode
+    game: GameManager
+    phase: str = serialize_field(str, lambda: "update")
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.game = GameManager.get_instance()
+        self.game.ticks.register(10, self.update_timings)
+
+    def update_timings(self) -> None:
+        timings = self.game.timings.get_percentiles(self.phase)
+
+        self.node.text = f"{self.phase} {timings['p50']:.1f}/{timings['p95']:.1f}/{timings['p99']:.1f} ms"
@@ -13,7 +13,7 @@ class TileMapStatisticComponent(Component):
         self._find_tile_map_id = self.game.ticks.register(10, self._find_tile_map)
     
     def _find_tile_map(self) -> None:
-        self.tile_map = self.node.scene.root_node.get_node_by_tag("TileMap")
+        self.tile_map = self.node.scene.get_node_by_tag("TileMap")
 
         if self.tile_map is None:
             return
@@ -36,5 +36,13 @@ class TileMapChunksComponent(TileMapStatisticComponent):
 
 class TileMapSpritesComponent(TileMapStatisticComponent):
     def update_data(self) -> None:
-        self.node.text = f"{len(self.tile_map.sprites)} sprites"
+        self.node.text = f"{len(self.tile_map.sprites) + len(self.tile_map.dynamic_sprites)} sprites"
         self.node.position = self.game.screen.get_width() - self.node.image.get_width(), 28
+
+
+class TileMapChunkPoolComponent(TileMapStatisticComponent):
+    def update_data(self) -> None:
+        stats = self.tile_map.tile_map.chunk_surfaces.get_stats()
+
+        self.node.text = f"{stats['hits']} pool hits, {stats['misses']} misses"
+        self.node.position = self.game.screen.get_width() - self.node.image.get_width(), 42
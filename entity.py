@@ -1,10 +1,12 @@
-from typing import Optional
+from typing import ClassVar, Optional
 
 from kit import Node, GameManager
 from tile_map import Sprite, TileMapNode
 
 
 class EntityNode(Node):
+    dynamic: ClassVar[bool] = False
+
     sprite: Sprite
     tile_map: Optional[TileMapNode]
     _find_tile_map_id: int
@@ -18,7 +20,7 @@ class EntityNode(Node):
         self.tile_map = None
 
     def _find_tile_map(self) -> None:
-        self.tile_map = self.scene.root_node.get_node_by_tag("TileMap")
+        self.tile_map = self.scene.get_node_by_tag("TileMap")
 
         if self.tile_map is None:
             return
@@ -26,8 +28,12 @@ class EntityNode(Node):
         game = GameManager.get_instance()
         game.ticks.unregister(self._find_tile_map_id)
         
-        self.tile_map.add_sprites([self.sprite])
+        if self.dynamic:
+            self.tile_map.add_dynamic_sprites([self.sprite])
+        else:
+            self.tile_map.add_sprites([self.sprite])
 
     def destroy(self) -> None:
-        self.is_alive = False
+        super().destroy()
+
         self.sprite.is_alive = False
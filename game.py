@@ -2,24 +2,32 @@ from __future__ import annotations
 
 import random
 from math import sin
+from typing import Optional
 
 import pygame as pg
 from pygame.key import get_pressed
 
-from kit import Node, Component, GameConfig, GameManager, DrawableNode
+from kit import Node, World, Component, GameConfig, GameManager, SwaySystem, DrawableNode
 
 from nodes import TextNode
 from entity import EntityNode
-from tile_map import Sprite, TileMapNode, AnimatedSprite
+from tile_map import Sprite, SpriteGroup, TileMapNode, AnimatedSprite
 from components import (
     UpsTextComponent, 
     FpsTextComponent, 
+    FrameTimingsTextComponent,
     TileMapTilesComponent,
     TileMapChunksComponent,
-    TileMapSpritesComponent
+    TileMapSpritesComponent,
+    TileMapChunkPoolComponent
 )
 from resources import Resources
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class TreeNode(EntityNode):
     speed: int
@@ -37,15 +45,83 @@ class TreeNode(EntityNode):
         self.offset = random.randint(0, 30)
         self.sprite.position = random.randint(0, 522), random.randint(32, 288 + 128)
 
+    def sway(self, ticks: int) -> None:
+        self.sprite.rotation = int(sin((ticks + self.offset) / self.speed) * 2)
+
+
+class ForestNode(Node):
+    world: Optional[World]
+    sprite_group: Optional[SpriteGroup]
+    trees: list[TreeNode]
+    tree_entities: list[int]
+
+    def __init__(self):
+        super().__init__()
+
+        self.world = None
+        self.sprite_group = None
+        self.trees = []
+        self.tree_entities = []
+
+        if np is not None:
+            self.world = World()
+            self.world.register_component("rotation", np.float64)
+            self.world.register_component("sway", np.float64, (3,))
+            self.world.add_systems([SwaySystem()])
+
+    def update_trees(self) -> None:
+        trees = [node for node in self.nodes if isinstance(node, TreeNode) and node.is_alive]
+
+        if trees == self.trees:
+            return
+
+        self.trees = trees
+
+        if self.world is None:
+            return
+
+        self.world.destroy_entities(self.tree_entities)
+        self.tree_entities = []
+        self.sprite_group = None
+
+        if not trees:
+            return
+
+        self.tree_entities = self.world.create_entities(
+            len(trees),
+            rotation=0,
+            sway=[(tree.speed, tree.offset, 2) for tree in trees]
+        ).tolist()
+        self.sprite_group = SpriteGroup(tree.sprite for tree in trees)
+
     def update(self) -> bool:
-        self.sprite.rotation = int(
-            sin((self.scene.game.ticks.ticks + self.offset) / self.speed) * 2
-        )
+        ticks = self.scene.game.ticks.ticks
+
+        self.update_trees()
+
+        if self.world is None:
+            for tree in self.trees:
+                tree.sway(ticks)
+
+            return super().update()
+
+        self.world.update(ticks)
+
+        if self.sprite_group is None:
+            return super().update()
+
+        if (tile_map := self.scene.get_node_by_tag("TileMap")) is not None:
+            tile_map.tile_map.transform_sprites(
+                self.sprite_group,
+                rotations=self.world.get_archetype(("rotation", "sway")).get_column("rotation")
+            )
 
         return super().update()
 
 
 class PlayerNode(EntityNode):
+    dynamic = True
+
     sprite: AnimatedSprite
 
     def __init__(self):
@@ -114,7 +190,7 @@ class Game(GameManager, init=False):
         main_scene.update_fields(
             root_node=DrawableNode().update_fields(
                 nodes=[
-                    Node().update_fields(
+                    ForestNode().update_fields(
                         nodes=[PlayerNode()] + [
                             TreeNode() for _ in range(2000)
                         ],
@@ -142,6 +218,15 @@ class Game(GameManager, init=False):
                                     FpsTextComponent()
                                 ]
                             )
+                        ] + [
+                            TextNode().update_fields(
+                                color=(255, 0, 0),
+                                position=(0, 28 + i * 14),
+                                components=[
+                                    FrameTimingsTextComponent().update_fields(phase=phase)
+                                ]
+                            )
+                            for i, phase in enumerate(("events", "update", "scene_draw", "flip"))
                         ]
                     ),
                     DrawableNode(
@@ -164,6 +249,12 @@ class Game(GameManager, init=False):
                                 components=[
                                     TileMapSpritesComponent()
                                 ]
+                            ),
+                            TextNode().update_fields(
+                                color=(0, 255, 0),
+                                components=[
+                                    TileMapChunkPoolComponent()
+                                ]
                             )
                         ]
                     )
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from .nodes import (
     Node as Node,
     Scene as Scene,
@@ -19,11 +21,24 @@ from .serialization import (
 
 from .manager import Manager as Manager
 from .animation import Animation as Animation
+from .asset_bundle import AssetBundle as AssetBundle
+from .ecs import (
+    World as World,
+    System as System,
+    Archetype as Archetype,
+    SwaySystem as SwaySystem,
+    MovementSystem as MovementSystem,
+    AnimationSystem as AnimationSystem
+)
 from .game_config import GameConfig as GameConfig
+from .frame_timings import FrameTimings as FrameTimings
+from .texture_atlas import AtlasTexture as AtlasTexture, TextureAtlas as TextureAtlas
 
 
-def destroy(node: Node, timeout: float = 0) -> None:
+def destroy(node: Node, timeout: float = 0) -> Optional[int]:
     if node.scene:
-        node.scene.destroy(node, timeout)
-    else:
-        node.destroy()
+        return node.scene.destroy(node, timeout)
+
+    node.destroy()
+
+    return None
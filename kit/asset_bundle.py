@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import mmap
+import struct
+from pickle import dumps, loads
+from typing import Any, BinaryIO
+
+from pygame.image import tobytes, frombuffer
+from pygame.surface import Surface
+
+BUNDLE_MAGIC = b"IRSB"
+BUNDLE_VERSION = 2
+BUNDLE_HEADER = struct.Struct("<4sIQ")
+
+TextureKey = tuple[str, float, bool, bool]
+
+
+class BundleTextures(dict[str, Surface]):
+    bundle: AssetBundle
+
+    def __init__(self, bundle: AssetBundle) -> None:
+        super().__init__()
+
+        self.bundle = bundle
+
+    def __missing__(self, texture_name: str) -> Surface:
+        self[texture_name] = texture = self.bundle.get_texture(texture_name)
+
+        return texture
+
+
+class AssetBundle:
+    file: BinaryIO
+    buffer: mmap.mmap
+    data_offset: int
+    textures: dict[str, tuple[int, int, int]]
+    variants: dict[TextureKey, tuple[int, int, int]]
+    animations: dict[str, Any]
+    sources: dict[str, int]
+
+    def __init__(self, path: str) -> None:
+        self.file = open(path, "rb")
+        self.buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        magic, version, index_size = BUNDLE_HEADER.unpack_from(self.buffer)
+
+        if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+            raise ValueError(f"{path} is not a version {BUNDLE_VERSION} asset bundle")
+
+        index = loads(self.buffer[BUNDLE_HEADER.size:BUNDLE_HEADER.size + index_size])
+
+        self.data_offset = BUNDLE_HEADER.size + index_size
+
+        self.textures = index["textures"]
+        self.variants = index["variants"]
+        self.animations = index["animations"]
+        self.sources = index["sources"]
+
+    def get_surface(self, entry: tuple[int, int, int]) -> Surface:
+        offset, w, h = entry
+        offset += self.data_offset
+
+        return frombuffer(memoryview(self.buffer)[offset:offset + w * h * 4], (w, h), "RGBA")
+
+    def get_texture(self, texture_name: str) -> Surface:
+        return self.get_surface(self.textures[texture_name])
+
+    def get_variant(self, data: TextureKey) -> Surface:
+        return self.get_surface(self.variants[data])
+
+    def has_variant(self, data: TextureKey) -> bool:
+        return data in self.variants
+
+
+def write_bundle(
+    path: str,
+    textures: dict[str, Surface],
+    variants: dict[TextureKey, Surface],
+    animations: dict[str, Any],
+    sources: dict[str, int]
+) -> None:
+    offset = 0
+    pixels: list[bytes] = []
+    entries: list[tuple[int, int, int]] = []
+
+    for surface in (*textures.values(), *variants.values()):
+        w, h = surface.get_size()
+        data = tobytes(surface, "RGBA")
+
+        pixels.append(data)
+        entries.append((offset, w, h))
+
+        offset += len(data)
+
+    index = dumps({
+        "textures": dict(zip(textures.keys(), entries)),
+        "variants": dict(zip(variants.keys(), entries[len(textures):])),
+        "animations": animations,
+        "sources": sources
+    })
+
+    with open(path, "wb") as file:
+        file.write(BUNDLE_HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, len(index)))
+        file.write(index)
+
+        for data in pixels:
+            file.write(data)
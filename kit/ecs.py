@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from typing import Any, ClassVar, Iterable, Optional
+from itertools import count
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class Archetype:
+    components: dict[str, tuple[Any, tuple[int, ...]]]
+    component_names: frozenset[str]
+    columns: dict[str, np.ndarray]
+    entities: np.ndarray
+    count: int
+    capacity: int
+
+    def __init__(self, components: dict[str, tuple[Any, tuple[int, ...]]], capacity: int = 1024) -> None:
+        self.components = components
+        self.component_names = frozenset(components)
+        self.count = 0
+        self.capacity = capacity
+
+        self.entities = np.zeros(capacity, dtype=np.int64)
+        self.columns = {
+            name: np.zeros((capacity, *shape), dtype=dtype)
+            for name, (dtype, shape) in components.items()
+        }
+
+    def resize(self, capacity: int) -> None:
+        self.entities = np.resize(self.entities, capacity)
+        self.columns = {
+            name: np.resize(column, (capacity, *column.shape[1:]))
+            for name, column in self.columns.items()
+        }
+        self.capacity = capacity
+
+    def reserve(self, entity_count: int) -> None:
+        if self.count + entity_count > self.capacity:
+            self.resize(max(self.capacity * 2, self.count + entity_count))
+
+    def add(self, entity_ids: np.ndarray, values: dict[str, Any]) -> int:
+        if not len(entity_ids):
+            return self.count
+
+        self.reserve(len(entity_ids))
+
+        start = self.count
+        self.count += len(entity_ids)
+
+        self.entities[start:self.count] = entity_ids
+
+        for name, column in self.columns.items():
+            column[start:self.count] = values.get(name, 0)
+
+        return start
+
+    def remove(self, row: int) -> Optional[int]:
+        self.count -= 1
+
+        if row == self.count:
+            return None
+
+        self.entities[row] = self.entities[self.count]
+
+        for column in self.columns.values():
+            column[row] = column[self.count]
+
+        return int(self.entities[row])
+
+    def get_column(self, name: str) -> np.ndarray:
+        return self.columns[name][:self.count]
+
+    def get_entities(self) -> np.ndarray:
+        return self.entities[:self.count]
+
+
+class System:
+    components: ClassVar[tuple[str, ...]] = ()
+
+    def update(self, world: World, archetype: Archetype) -> None:
+        ...
+
+
+class MovementSystem(System):
+    components = "position", "velocity"
+
+    def update(self, world: World, archetype: Archetype) -> None:
+        archetype.get_column("position")[:] += archetype.get_column("velocity")
+
+
+class AnimationSystem(System):
+    components = "animation", "texture"
+
+    def update(self, world: World, archetype: Archetype) -> None:
+        animation = archetype.get_column("animation")
+        texture = archetype.get_column("texture")
+
+        first_texture, frame_count, frame_rate, frame_i = animation.T
+
+        due = frame_i % frame_rate == 0
+        texture[due] = first_texture[due] + (texture[due] - first_texture[due] + 1) % frame_count[due]
+
+        frame_i += 1
+
+
+class SwaySystem(System):
+    components = "rotation", "sway"
+
+    def update(self, world: World, archetype: Archetype) -> None:
+        speed, offset, amplitude = archetype.get_column("sway").T
+
+        np.trunc(np.sin((world.ticks + offset) / speed) * amplitude, out=archetype.get_column("rotation"))
+
+
+class World:
+    ticks: int
+    component_specs: dict[str, tuple[Any, tuple[int, ...]]]
+    archetypes: dict[frozenset[str], Archetype]
+    locations: dict[int, tuple[Archetype, int]]
+    systems: list[System]
+
+    _entity_ids: Iterable[int]
+
+    def __init__(self) -> None:
+        if np is None:
+            raise ImportError("World requires numpy")
+
+        self.ticks = 0
+        self.component_specs = {}
+        self.archetypes = {}
+        self.locations = {}
+        self.systems = []
+
+        self._entity_ids = count()
+
+    def register_component(self, name: str, dtype: Any, shape: tuple[int, ...] = ()) -> None:
+        self.component_specs[name] = dtype, shape
+
+    def add_systems(self, systems: Iterable[System]) -> None:
+        self.systems.extend(systems)
+
+    def get_archetype(self, component_names: Iterable[str]) -> Archetype:
+        component_names = frozenset(component_names)
+
+        if (archetype := self.archetypes.get(component_names)) is None:
+            self.archetypes[component_names] = archetype = Archetype({
+                name: self.component_specs[name]
+                for name in sorted(component_names)
+            })
+
+        return archetype
+
+    def create_entities(self, entity_count: int, **values: Any) -> np.ndarray:
+        archetype = self.get_archetype(values)
+        entity_ids = np.fromiter(self._entity_ids, dtype=np.int64, count=entity_count)
+
+        start = archetype.add(entity_ids, values)
+
+        self.locations.update(zip(entity_ids.tolist(), ((archetype, row) for row in count(start))))
+
+        return entity_ids
+
+    def create_entity(self, **values: Any) -> int:
+        return int(self.create_entities(1, **values)[0])
+
+    def destroy_entity(self, entity_id: int) -> None:
+        archetype, row = self.locations.pop(entity_id)
+
+        if (moved_entity_id := archetype.remove(row)) is not None:
+            self.locations[moved_entity_id] = archetype, row
+
+    def destroy_entities(self, entity_ids: Iterable[int]) -> None:
+        for entity_id in entity_ids:
+            self.destroy_entity(int(entity_id))
+
+    def get_component(self, entity_id: int, name: str) -> Any:
+        archetype, row = self.locations[entity_id]
+
+        return archetype.columns[name][row]
+
+    def set_component(self, entity_id: int, name: str, value: Any) -> None:
+        archetype, row = self.locations[entity_id]
+
+        archetype.columns[name][row] = value
+
+    def update(self, ticks: Optional[int] = None) -> None:
+        self.ticks = self.ticks + 1 if ticks is None else ticks
+
+        for system in self.systems:
+            for archetype in self.archetypes.values():
+                if archetype.count and archetype.component_names.issuperset(system.components):
+                    system.update(self, archetype)
+
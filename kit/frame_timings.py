@@ -0,0 +1,51 @@
+import time
+from typing import Generator
+from contextlib import contextmanager
+from collections import deque
+
+
+class FrameTimings:
+    size: int
+    enabled: bool
+    track_listeners: bool
+    samples: dict[str, deque[float]]
+
+    def __init__(self, size: int = 240, enabled: bool = True, track_listeners: bool = False) -> None:
+        self.size = size
+        self.enabled = enabled
+        self.track_listeners = track_listeners
+        self.samples = {}
+
+    def record(self, phase: str, seconds: float) -> None:
+        if not self.enabled:
+            return
+
+        if (samples := self.samples.get(phase)) is None:
+            self.samples[phase] = samples = deque(maxlen=self.size)
+
+        samples.append(seconds * 1000)
+
+    @contextmanager
+    def measure(self, phase: str) -> Generator[None, None, None]:
+        start = time.perf_counter()
+
+        yield
+
+        self.record(phase, time.perf_counter() - start)
+
+    def get_percentiles(self, phase: str) -> dict[str, float]:
+        samples = sorted(self.samples.get(phase, ()))
+
+        if not samples:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+
+        return {
+            name: samples[min(int(len(samples) * p), len(samples) - 1)]
+            for name, p in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99))
+        }
+
+    def get_stats(self) -> dict[str, dict[str, float]]:
+        return {
+            phase: self.get_percentiles(phase)
+            for phase in self.samples
+        }
@@ -1,12 +1,17 @@
 import time
+from typing import Optional
+from threading import Thread
+from collections import deque
 
 from pygame.time import Clock
-from pygame.event import get as get_events
+from pygame.event import Event, get as get_events
 from pygame.surface import Surface
 from pygame.display import flip, set_mode
 
 from ..manager import Manager
 from ..game_config import GameConfig
+from ..frame_timings import FrameTimings
+from ..nodes.scene import DrawList
 
 from .ticks_manager import TicksManager
 from .events_manager import EventsManager
@@ -18,6 +23,7 @@ class GameManager(Manager, init=False):
     fps: float
     ups_clock: Clock
     fps_clock: Clock
+    timings: FrameTimings
 
     ticks: TicksManager
     events: EventsManager
@@ -27,6 +33,13 @@ class GameManager(Manager, init=False):
 
     max_ups: int
     max_fps: int
+    max_catch_up_updates: int
+    sleep_margin: float
+
+    threaded_rendering: bool
+    draw_list: Optional[DrawList]
+    event_queue: deque[Event]
+    simulation_error: Optional[BaseException]
 
     _ups_interval: float
     _fps_interval: float
@@ -38,45 +51,145 @@ class GameManager(Manager, init=False):
         self.fps = 0
         self.ups_clock = Clock()
         self.fps_clock = Clock()
+        self.timings = FrameTimings()
 
         self.ticks = TicksManager()
         self.events = EventsManager()
         self.scenes = ScenesManager()
 
+        self.ticks.timings = self.timings
+        self.scenes.timings = self.timings
+
         self.screen = set_mode(
             size=config.screen_size, 
-            flags=config.flags
+            flags=config.flags,
+            vsync=int(config.vsync)
         )
 
         self.max_ups = 60
-        self.max_fps = 2400
+        self.max_fps = 120
+        self.max_catch_up_updates = 5
+        self.sleep_margin = 0
+
+        self.threaded_rendering = False
+        self.draw_list = None
+        self.event_queue = deque()
+        self.simulation_error = None
 
         self._ups_interval = 1 / self.max_ups
+        self._fps_interval = 1 / self.max_fps
 
     def update(self) -> None:
         self.ticks.update()
 
     def draw(self) -> None:
-        flip()
+        with self.timings.measure("flip"):
+            flip()
+
+    def sleep_until(self, deadline: float) -> None:
+        while (remaining := deadline - time.perf_counter()) > 0:
+            if remaining > self.sleep_margin:
+                time.sleep(remaining - self.sleep_margin)
+
+    def present(self, draw_list: DrawList) -> None:
+        with self.timings.measure("present"):
+            self.screen.fill((0, 0, 0))
+            self.screen.fblits(draw_list)
+
+        with self.timings.measure("flip"):
+            flip()
+
+    def run_updates(self, current_time: float, next_update_time: float) -> float:
+        updates = 0
+
+        while current_time >= next_update_time and updates < self.max_catch_up_updates:
+            with self.timings.measure("update"):
+                self.update()
+
+            next_update_time += self._ups_interval
+            updates += 1
+
+            self.ups_clock.tick()
+            self.ups = self.ups_clock.get_fps()
+
+        if current_time >= next_update_time:
+            next_update_time = current_time + self._ups_interval
+
+        return next_update_time
+
+    def simulate(self) -> None:
+        next_update_time = time.perf_counter()
+
+        try:
+            while 1:
+                with self.timings.measure("events"):
+                    while self.event_queue:
+                        self.events.broadcast(self.event_queue.popleft())
+
+                current_time = time.perf_counter()
+
+                if current_time >= next_update_time:
+                    next_update_time = self.run_updates(current_time, next_update_time)
+
+                    with self.timings.measure("snapshot"):
+                        self.draw_list = self.scenes.get_draw_list()
+
+                self.sleep_until(next_update_time)
+        except BaseException as error:
+            self.simulation_error = error
+
+    def run_threaded(self) -> None:
+        simulation = Thread(target=self.simulate, name="simulation", daemon=True)
+        simulation.start()
+
+        presented_draw_list = None
+        next_draw_time = time.perf_counter()
+
+        while simulation.is_alive():
+            self.event_queue.extend(get_events())
+
+            if (draw_list := self.draw_list) is not presented_draw_list:
+                self.present(draw_list)
+                presented_draw_list = draw_list
+
+                self.fps_clock.tick()
+                self.fps = self.fps_clock.get_fps()
+
+            next_draw_time = max(next_draw_time + self._fps_interval, time.perf_counter())
+
+            self.sleep_until(next_draw_time)
+
+        if self.simulation_error is not None:
+            raise self.simulation_error
 
     def run(self) -> None:
-        last_ups_time = 0
+        self._ups_interval = 1 / self.max_ups
+        self._fps_interval = 1 / self.max_fps
+
+        if self.threaded_rendering:
+            return self.run_threaded()
+
+        next_update_time = next_draw_time = time.perf_counter()
+        updated = False
 
         while 1:
-            current_time = time.time()
+            with self.timings.measure("events"):
+                for event in get_events():
+                    self.events.broadcast(event)
 
-            for event in get_events():
-                self.events.broadcast(event)
+            current_time = time.perf_counter()
 
-            if current_time - last_ups_time >= self._ups_interval:
-                self.update()
+            if current_time >= next_update_time:
+                next_update_time = self.run_updates(current_time, next_update_time)
+                updated = True
 
-                last_ups_time = current_time
+            if updated and current_time >= next_draw_time:
+                self.draw()
+                updated = False
 
-                self.ups = self.ups_clock.get_fps()
-                self.ups_clock.tick(self.max_ups)
+                next_draw_time = max(next_draw_time + self._fps_interval, current_time)
 
-            self.draw()
+                self.fps_clock.tick()
+                self.fps = self.fps_clock.get_fps()
 
-            self.fps = self.fps_clock.get_fps()
-            self.fps_clock.tick(self.max_fps)
+            self.sleep_until(min(next_update_time, next_draw_time) if updated else next_update_time)
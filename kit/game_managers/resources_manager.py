@@ -1,4 +1,6 @@
-from typing import Optional
+import os
+from typing import Iterable, Optional
+from collections import OrderedDict
 
 from pygame.image import load as pg_load
 from pygame.surface import Surface
@@ -6,51 +8,205 @@ from pygame.transform import flip, scale, rotate
 
 from ..manager import Manager
 from ..animation import Animation
+from ..asset_bundle import AssetBundle, BundleTextures, write_bundle
+from ..texture_atlas import AtlasTexture, TextureAtlas
 
 
 class ResourcesManager(Manager, init=False):
     textures: dict[str, Surface]
     animations: dict[str, list[str]]
-    cached_textures: dict[tuple[str, float, bool, bool], Surface]
+    texture_sources: dict[str, int]
+    cached_textures: OrderedDict[tuple[str, float, bool, bool], AtlasTexture]
+
+    bundle: Optional[AssetBundle]
+    atlas: Optional[TextureAtlas]
+    atlas_size: tuple[int, int]
+
+    rotation_step: Optional[float]
+    max_cached_bytes: Optional[int]
+    max_cached_textures: Optional[int]
+
+    cached_bytes: int
+    cache_hits: int
+    cache_misses: int
+    cache_evictions: int
 
     def __init__(self):
         super().__init__()
-        
+
         self.textures = {}
         self.animations = {}
-        self.cached_textures = {}
+        self.texture_sources = {}
+        self.cached_textures = OrderedDict()
+
+        self.bundle = None
+        self.atlas = None
+        self.atlas_size = 1024, 1024
+
+        self.rotation_step = None
+        self.max_cached_bytes = None
+        self.max_cached_textures = 4096
+
+        self.cached_bytes = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_evictions = 0
 
     def load_texture(self, path: str, size: Optional[tuple[int, int]] = None) -> Surface:
         texture = pg_load("assets/" + path).convert_alpha()
-        
+        self.texture_sources[path] = os.stat("assets/" + path).st_mtime_ns
+
         if size:
             return scale(texture, size)
         return texture
 
+    def is_bundle_current(self, bundle: AssetBundle) -> bool:
+        for path, mtime in bundle.sources.items():
+            try:
+                if os.stat("assets/" + path).st_mtime_ns != mtime:
+                    return False
+            except FileNotFoundError:
+                return False
+
+        return True
+
+    def load_bundle(self, path: str) -> bool:
+        try:
+            bundle = AssetBundle("assets/" + path)
+        except ValueError:
+            return False
+
+        if not self.is_bundle_current(bundle):
+            return False
+
+        self.bundle = bundle
+        self.textures = BundleTextures(bundle)
+        self.animations = bundle.animations
+        self.texture_sources = bundle.sources
+
+        return True
+
+    def save_bundle(self, path: str) -> None:
+        write_bundle(
+            "assets/" + path,
+            self.textures,
+            {
+                data: atlas_texture.atlas.subsurface(atlas_texture.rect)
+                for data, atlas_texture in self.cached_textures.items()
+                if data[1:] != (0, False, False)
+            },
+            self.animations,
+            self.texture_sources
+        )
+
+    def pack_texture(self, texture: Surface) -> AtlasTexture:
+        if self.atlas is not None and (atlas_texture := self.atlas.add(texture)) is not None:
+            return atlas_texture
+
+        w, h = texture.get_size()
+        self.atlas = TextureAtlas((max(w, self.atlas_size[0]), max(h, self.atlas_size[1])))
+
+        return self.atlas.add(texture)
+
+    def build_atlas(self) -> None:
+        texture_names = self.textures if self.bundle is None else self.bundle.textures
+
+        for texture_name in sorted(
+            texture_names,
+            key=lambda texture_name: self.textures[texture_name].get_height(),
+            reverse=True
+        ):
+            data = texture_name, 0, False, False
+
+            if data not in self.cached_textures:
+                self.bake_texture(data)
+
+    def quantize_rotation(self, rotation: float) -> float:
+        if not self.rotation_step:
+            return rotation
+
+        return round(rotation / self.rotation_step) * self.rotation_step
+
+    def bake_texture(self, data: tuple[str, float, bool, bool]) -> AtlasTexture:
+        texture_name, rotation, flip_x, flip_y = data
+
+        if self.bundle is not None and self.bundle.has_variant(data):
+            cached_texture = self.bundle.get_variant(data)
+        else:
+            cached_texture = self.textures[texture_name]
+
+            if rotation:
+                cached_texture = rotate(cached_texture, rotation)
+
+            if flip_x or flip_y:
+                cached_texture = flip(cached_texture, flip_x, flip_y)
+
+        if self.max_cached_bytes is None:
+            atlas_texture = self.pack_texture(cached_texture)
+        else:
+            atlas_texture = AtlasTexture(cached_texture, cached_texture.get_rect())
+
+        self.cached_textures[data] = atlas_texture
+        self.cached_bytes += self.get_texture_bytes(atlas_texture)
+
+        self.evict_textures()
+
+        return atlas_texture
+
+    def get_texture_bytes(self, atlas_texture: AtlasTexture) -> int:
+        return atlas_texture.rect.width * atlas_texture.rect.height * atlas_texture.atlas.get_bytesize()
+
+    def evict_textures(self) -> None:
+        while len(self.cached_textures) > 1 and (
+            (self.max_cached_textures is not None and len(self.cached_textures) > self.max_cached_textures)
+            or (self.max_cached_bytes is not None and self.cached_bytes > self.max_cached_bytes)
+        ):
+            _, atlas_texture = self.cached_textures.popitem(last=False)
+
+            self.cached_bytes -= self.get_texture_bytes(atlas_texture)
+            self.cache_evictions += 1
+
+    def prewarm_texture(
+        self,
+        texture_name: str,
+        rotations: Iterable[float],
+        flip_x: bool = False,
+        flip_y: bool = False
+    ) -> None:
+        for rotation in rotations:
+            data = texture_name, self.quantize_rotation(rotation), flip_x, flip_y
+
+            if data not in self.cached_textures:
+                self.bake_texture(data)
+
     def get_texture(
-        self, 
+        self,
         texture_name: str,
         rotation: float,
         flip_x: bool,
         flip_y: bool
-    ) -> tuple[tuple[int, int], Surface]:
-        data = texture_name, rotation, flip_x, flip_y
+    ) -> tuple[tuple[int, int], AtlasTexture]:
+        data = texture_name, self.quantize_rotation(rotation), flip_x, flip_y
+        size = self.textures[texture_name].get_size()
+
+        if (atlas_texture := self.cached_textures.get(data)) is not None:
+            self.cache_hits += 1
+            self.cached_textures.move_to_end(data)
 
-        if data in self.cached_textures:
-            return self.textures[texture_name].get_size(), self.cached_textures[data]
+            return size, atlas_texture
 
-        cached_texture = self.textures[texture_name]
-        size = cached_texture.get_size()
+        self.cache_misses += 1
 
-        if rotation:
-            cached_texture = rotate(cached_texture, rotation)
-    
-        if flip_x or flip_y:
-            cached_texture = flip(cached_texture, flip_x, flip_y)
+        return size, self.bake_texture(data)
 
-        self.cached_textures[data] = cached_texture
+    def get_cache_stats(self) -> dict[str, int]:
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "evictions": self.cache_evictions,
+            "textures": len(self.cached_textures),
+            "bytes": self.cached_bytes
+        }
 
-        return size, cached_texture
-    
     def get_animation(self, animation_name: str) -> Animation:
         return self.animations[animation_name]
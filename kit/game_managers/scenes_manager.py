@@ -2,19 +2,22 @@ from __future__ import annotations
 
 from typing import Optional
 
-from ..nodes.scene import Scene
+from ..nodes.scene import Scene, DrawList
 from ..manager import Manager
+from ..frame_timings import FrameTimings
 
 
 class ScenesManager(Manager, init=False):
     scenes: dict[str, Scene]
     current_scene: Optional[Scene]
+    timings: Optional[FrameTimings]
 
     def __init__(self) -> None:
         super().__init__()
         
         self.scenes = {}
         self.current_scene = None
+        self.timings = None
 
     def create_scene(self, name: str) -> Scene:
         scene = Scene()
@@ -32,4 +35,14 @@ class ScenesManager(Manager, init=False):
  
     def draw(self) -> None:
         self.check_current_scene()
-        self.current_scene.draw()
+
+        if self.timings is None:
+            self.current_scene.draw()
+        else:
+            with self.timings.measure("scene_draw"):
+                self.current_scene.draw()
+
+    def get_draw_list(self) -> DrawList:
+        self.check_current_scene()
+
+        return self.current_scene.get_draw_list()
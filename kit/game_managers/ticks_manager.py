@@ -1,56 +1,105 @@
 import time
-from typing import Callable 
+from typing import Callable, Optional
+from collections import defaultdict
 
 from ..manager import Manager
+from ..frame_timings import FrameTimings
 
 
 class TicksManager(Manager, init=False):
     ticks: int
-    listeners: dict[int, dict[int, Callable]]
+    wheels: list[tuple[int, list[dict[int, Callable]]]]
+    periods: dict[int, list[dict[int, Callable]]]
+    next_phases: dict[int, int]
+    listener_slots: dict[int, dict[int, Callable]]
+    register_list: list[tuple[dict[int, Callable], int, Callable]]
     unregister_set: set[int]
     next_listener_id: int
+    dispatching: bool
+    timings: Optional[FrameTimings]
 
     def __init__(self) -> None:
         super().__init__()
 
         self.ticks = 0
-        self.listeners = {}
+        self.wheels = []
+        self.periods = {}
+        self.next_phases = {}
+        self.listener_slots = {}
+        self.register_list = []
         self.unregister_set = set()
         self.next_listener_id = 0
+        self.dispatching = False
+        self.timings = None
 
     def update(self) -> None:
         self.ticks += 1
+        self.dispatching = True
 
-        for ticks, listeners in list(self.listeners.items()):
-            if self.ticks % ticks == 0:
-                for listener in list(listeners.values()):
-                    listener()
+        if self.timings is not None and self.timings.enabled and self.timings.track_listeners:
+            self.call_timed_listeners(self.timings)
+        else:
+            for ticks, slots in self.wheels:
+                if slot := slots[self.ticks % ticks]:
+                    for listener in slot.values():
+                        listener()
 
-        for ticks, listeners in self.listeners.items():
-            self.listeners[ticks] = {
-                _listener_id: listener
-                for _listener_id, listener in listeners.items()
-                if _listener_id not in self.unregister_set
-            }
+        self.dispatching = False
 
-        self.listeners = {
-            ticks: listeners
-            for ticks, listeners in self.listeners.items()
-            if listeners
-        }
+        if self.register_list:
+            for slot, listener_id, listener in self.register_list:
+                slot[listener_id] = listener
 
-        self.unregister_set = set()
+            self.register_list.clear()
+
+        if self.unregister_set:
+            for listener_id in self.unregister_set:
+                self.remove_listener(listener_id)
+
+            self.unregister_set.clear()
+
+    def call_timed_listeners(self, timings: FrameTimings) -> None:
+        listener_times: defaultdict[str, float] = defaultdict(float)
+
+        for ticks, slots in self.wheels:
+            for listener in slots[self.ticks % ticks].values():
+                start = time.perf_counter()
+                listener()
+                listener_times[getattr(listener, "__qualname__", type(listener).__qualname__)] += (
+                    time.perf_counter() - start
+                )
 
-    def register(self, ticks: int, listener: Callable) -> int:
+        for name, seconds in listener_times.items():
+            timings.record("tick:" + name, seconds)
+
+    def register(self, ticks: int, listener: Callable, phase: Optional[int] = None) -> int:
         listener_id = self.next_listener_id
         self.next_listener_id += 1
 
-        if ticks not in self.listeners:
-            self.listeners[ticks] = {}
+        if ticks not in self.periods:
+            self.periods[ticks] = [{} for _ in range(ticks)]
+            self.next_phases[ticks] = 0
+            self.wheels.append((ticks, self.periods[ticks]))
+
+        if phase is None:
+            phase = self.next_phases[ticks]
+            self.next_phases[ticks] = (phase + 1) % ticks
 
-        self.listeners[ticks][listener_id] = listener
+        self.listener_slots[listener_id] = slot = self.periods[ticks][phase % ticks]
+
+        if self.dispatching:
+            self.register_list.append((slot, listener_id, listener))
+        else:
+            slot[listener_id] = listener
 
         return listener_id
 
     def unregister(self, listener_id: int) -> None:
-        self.unregister_set.add(listener_id)
+        if self.dispatching:
+            self.unregister_set.add(listener_id)
+        else:
+            self.remove_listener(listener_id)
+
+    def remove_listener(self, listener_id: int) -> None:
+        if (slot := self.listener_slots.pop(listener_id, None)) is not None:
+            slot.pop(listener_id, None)
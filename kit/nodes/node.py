@@ -15,7 +15,7 @@ NodeT = TypeVar("NodeT", bound="Node")
 
 
 class Node(Serializable):
-    tag: str = serialize_field(str, lambda: "Node")
+    _tag: str = serialize_field(str, lambda: "Node", "tag")
     _nodes: list[Node] = serialize_field(list, lambda: [], "nodes")
     _components: list[Component] = serialize_field(list, lambda: [], "components")
 
@@ -38,13 +38,18 @@ class Node(Serializable):
         self.scene = scenes_manager.current_scene
 
     def add_nodes(self, nodes: Iterable[Node]) -> None:
-        self.nodes.extend(
+        nodes = [
             node.update_fields(
                 scene=self.scene, 
                 parent=self
             ) 
             for node in nodes
-        )
+        ]
+
+        self.nodes.extend(nodes)
+
+        if self.scene is not None and self.scene.has_node(self):
+            self.scene.reindex_nodes(self, (), nodes)
 
     def get_node_by_tag(self, tag: str) -> Optional[Node]:
         for node in self.nodes:
@@ -57,24 +62,56 @@ class Node(Serializable):
         return None
 
     def update(self) -> bool:
-        if self.nodes:
-            self.nodes = [
-                node
-                for node in self.nodes
-                if node.update()
-            ]
+        nodes = self._nodes
+        dead_nodes = None
+        alive_count = 0
+
+        for index, node in enumerate(nodes):
+            if node.update():
+                if alive_count != index:
+                    nodes[alive_count] = node
+
+                alive_count += 1
+            elif dead_nodes is None:
+                dead_nodes = [node]
+            else:
+                dead_nodes.append(node)
+
+        if dead_nodes is not None:
+            del nodes[alive_count:]
+
+            if self.scene is not None and self.scene.has_node(self):
+                self.scene.unindex_nodes(self, dead_nodes)
 
         return self.is_alive
     
     def destroy(self) -> None:
         self.is_alive = False
 
+        if self.scene is not None and self.scene.has_node(self):
+            self.scene.unindex_tree(self)
+
+    @property
+    def tag(self) -> str:
+        return self._tag
+
+    @tag.setter
+    def tag(self, tag: str) -> None:
+        if self.scene is not None and self.scene.has_node(self):
+            self.scene.unindex_node(self)
+            self._tag = tag
+            self.scene.index_node(self)
+        else:
+            self._tag = tag
+
     @property
     def nodes(self) -> list[Node]:
         return self._nodes
     
     @nodes.setter
     def nodes(self, nodes: Iterable[Node]) -> None:
+        previous_nodes = self._nodes or ()
+
         self._nodes = [
             node.update_fields(
                 scene=self.scene,
@@ -83,6 +120,9 @@ class Node(Serializable):
             for node in nodes
         ]
 
+        if self.scene is not None and self.scene.has_node(self):
+            self.scene.reindex_nodes(self, previous_nodes, self._nodes)
+
     @property
     def components(self) -> list[Component]:
         return self._components
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import time
-from typing import Optional, TYPE_CHECKING
-from collections import deque
+from heapq import heappop, heappush
+from typing import Iterable, Optional, TYPE_CHECKING
+from operator import attrgetter
+from itertools import count
+from collections import defaultdict
+
+from pygame.surface import Surface
 
 from ..manager import Manager
 from ..serialization import serialize_field, Serializable
@@ -13,38 +18,157 @@ from .drawable_node import DrawableNode
 if TYPE_CHECKING:
     from ..game_managers.game_manager import GameManager
 
+DrawList = tuple[tuple[Surface, tuple[int, int]], ...]
+
+get_render_data = attrgetter("image", "position")
+
 
 class Scene(Serializable):
-    root_node: DrawableNode = serialize_field(Node, lambda: DrawableNode())
+    _root_node: DrawableNode = serialize_field(Node, lambda: DrawableNode(), "root_node")
 
     game: GameManager
-    destroy_deque: deque[tuple[Node, float]]
+    destroy_queue: list[tuple[float, int]]
+    pending_destroys: dict[int, tuple[Node, ...]]
+    destroy_ids: count
+    tagged_nodes: defaultdict[str, dict[Node, None]]
+    render_nodes: Optional[list[DrawableNode]]
+
+    def __pre_init__(self) -> None:
+        super().__pre_init__()
+
+        self.tagged_nodes = defaultdict(dict)
+        self.render_nodes = None
 
     def __init__(self) -> None:
         super().__init__()
 
         self.game = Manager.get_instance_by_name("GameManager")
         self.game.ticks.register(1, self.update)
-        self.destroy_deque = deque()
+        self.destroy_queue = []
+        self.pending_destroys = {}
+        self.destroy_ids = count()
+
+    @property
+    def root_node(self) -> DrawableNode:
+        return self._root_node
+
+    @root_node.setter
+    def root_node(self, root_node: DrawableNode) -> None:
+        self._root_node = root_node
+        self.tagged_nodes = defaultdict(dict)
+        self.render_nodes = None
+
+        root_node.scene = self
+
+        for node in root_node.nodes:
+            self.index_tree(node)
 
     def get_node_by_tag(self, tag: str) -> Optional[Node]:
-        return self.root_node.get_node_by_tag(tag)
+        if nodes := self.tagged_nodes.get(tag):
+            return next(iter(nodes))
+
+        return None
+
+    def get_nodes_by_tag(self, tag: str) -> list[Node]:
+        return list(self.tagged_nodes.get(tag, ()))
+
+    def has_node(self, node: Node) -> bool:
+        return node is self._root_node or node in self.tagged_nodes.get(node.tag, ())
+
+    def index_node(self, node: Node) -> None:
+        self.tagged_nodes[node.tag][node] = None
+
+    def unindex_node(self, node: Node) -> None:
+        if (nodes := self.tagged_nodes.get(node.tag)) is not None:
+            nodes.pop(node, None)
+
+            if not nodes:
+                del self.tagged_nodes[node.tag]
+
+    def index_tree(self, node: Node) -> None:
+        if not node.is_alive:
+            return
+
+        self.index_node(node)
+
+        for subnode in node.nodes:
+            self.index_tree(subnode)
+
+    def unindex_tree(self, node: Node) -> None:
+        self.unindex_node(node)
+
+        for subnode in node.nodes:
+            self.unindex_tree(subnode)
+
+    def reindex_nodes(self, parent: Node, previous_nodes: Iterable[Node], nodes: list[Node]) -> None:
+        kept_nodes = set(nodes)
+        drawable_parent = isinstance(parent, DrawableNode)
+        removed_nodes = [node for node in previous_nodes if node not in kept_nodes]
+
+        if drawable_parent and any(isinstance(node, DrawableNode) for node in removed_nodes):
+            self.render_nodes = None
+
+        self.unindex_nodes(parent, [
+            node
+            for node in removed_nodes
+            if node.parent is parent
+        ])
+
+        for node in nodes:
+            if not self.has_node(node):
+                self.index_tree(node)
+
+            if drawable_parent and isinstance(node, DrawableNode):
+                self.render_nodes = None
+
+    def unindex_nodes(self, parent: Node, nodes: list[Node]) -> None:
+        drawable_parent = isinstance(parent, DrawableNode)
+
+        for node in nodes:
+            self.unindex_tree(node)
+
+            if drawable_parent and isinstance(node, DrawableNode):
+                self.render_nodes = None
+
+    def get_render_nodes(self) -> list[DrawableNode]:
+        if self.render_nodes is None:
+            self.render_nodes = list(self._root_node.get_render_nodes())
+
+        return self.render_nodes
 
     def update(self) -> None:
-        current_timestamp = time.time()
+        if self.destroy_queue:
+            current_time = time.monotonic()
+
+            while self.destroy_queue and self.destroy_queue[0][0] <= current_time:
+                _, destroy_id = heappop(self.destroy_queue)
 
-        for node, timestamp in self.destroy_deque:
-            if timestamp <= current_timestamp:
-                node.destroy()
+                if (nodes := self.pending_destroys.pop(destroy_id, None)) is not None:
+                    for node in nodes:
+                        node.destroy()
 
         self.root_node.update()
 
-    def destroy(self, node: Node, timeout: float) -> None:
-        self.destroy_deque.append((node, time.time() + timeout))
+    def destroy(self, node: Node, timeout: float) -> int:
+        return self.destroy_nodes((node,), timeout)
+
+    def destroy_nodes(self, nodes: Iterable[Node], timeout: float) -> int:
+        destroy_id = next(self.destroy_ids)
+
+        self.pending_destroys[destroy_id] = tuple(nodes)
+        heappush(self.destroy_queue, (time.monotonic() + timeout, destroy_id))
+
+        return destroy_id
+
+    def cancel_destroy(self, destroy_id: int) -> bool:
+        return self.pending_destroys.pop(destroy_id, None) is not None
+
+    def get_draw_list(self) -> DrawList:
+        return tuple(
+            (node.image.copy(), node.position)
+            for node in self.get_render_nodes()
+        )
 
     def draw(self) -> None:
         self.game.screen.fill((0, 0, 0))
-        self.game.screen.fblits(
-            (node.image, node.position)
-            for node in self.root_node.get_render_nodes()
-        )
+        self.game.screen.fblits(map(get_render_data, self.get_render_nodes()))
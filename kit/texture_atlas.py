@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import Optional, NamedTuple
+
+import pygame as pg
+from pygame.rect import Rect
+from pygame.surface import Surface
+
+
+class AtlasTexture(NamedTuple):
+    atlas: Surface
+    rect: Rect
+
+    def get_size(self) -> tuple[int, int]:
+        return self.rect.size
+
+
+class TextureAtlas:
+    image: Surface
+    shelves: list[Rect]
+
+    def __init__(self, size: tuple[int, int]) -> None:
+        self.image = Surface(size, pg.SRCALPHA)
+        self.shelves = []
+
+    def add(self, texture: Surface) -> Optional[AtlasTexture]:
+        w, h = texture.get_size()
+        atlas_w, atlas_h = self.image.get_size()
+
+        for shelf in self.shelves:
+            if h <= shelf.height and shelf.width + w <= atlas_w:
+                position = shelf.width, shelf.y
+                shelf.width += w
+
+                return self.place(texture, position)
+
+        y = self.shelves[-1].bottom if self.shelves else 0
+
+        if w > atlas_w or y + h > atlas_h:
+            return None
+
+        self.shelves.append(Rect(0, y, w, h))
+
+        return self.place(texture, (0, y))
+
+    def place(self, texture: Surface, position: tuple[int, int]) -> AtlasTexture:
+        self.image.blit(texture, position, special_flags=pg.BLEND_RGBA_MAX)
+
+        return AtlasTexture(self.image, Rect(position, texture.get_size()))
@@ -1,10 +1,20 @@
+import os
+
 from kit import Animation, ResourcesManager
 
+BUNDLE_PATH = "resources.bundle"
+
 
 class Resources(ResourcesManager, init=False):    
-    def __init__(self) -> None:
+    def __init__(self, use_bundle: bool = True) -> None:
         super().__init__()
 
+        if not (use_bundle and os.path.exists("assets/" + BUNDLE_PATH) and self.load_bundle(BUNDLE_PATH)):
+            self.load_assets()
+
+        self.prewarm_texture("tree-0", range(-2, 3))
+
+    def load_assets(self) -> None:
         self.textures = {
             "tree-0": self.load_texture("tree-0.png"),
             "tree-1": self.load_texture("tree-1.png"),
@@ -1,62 +1,121 @@
 from __future__ import annotations
 
 import time
+from sys import getsizeof
 from math import ceil
-from typing import Union, Iterable, Generator, Optional
-from threading import Lock
-from itertools import chain
-from collections import deque
+from bisect import bisect_left, bisect_right
+from typing import Union, Iterable, Iterator, ClassVar, Generator, Optional
+from threading import RLock
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter, itemgetter
+from itertools import chain, count
+from collections import deque, OrderedDict
 
 import pygame as pg
 from pygame.rect import Rect
 from pygame.surface import Surface
 
-from kit import DrawableNode, ResourcesManager
+from kit import AtlasTexture, DrawableNode, ResourcesManager
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+get_sprite_depth = attrgetter("depth")
+
+
+def to_position(values: Iterable[float]) -> tuple[Union[int, float], ...]:
+    return tuple(int(value) if value.is_integer() else value for value in values)
+
+
+class DepthList(list):
+    __slots__ = ()
+
+    def index(self, sprite: Sprite) -> int:
+        i = bisect_left(self, sprite.depth, key=get_sprite_depth)
+
+        if i == len(self) or self[i] is not sprite:
+            raise ValueError(f"{sprite} is not in depth list")
+
+        return i
+
+    def add(self, sprite: Sprite) -> None:
+        self.insert(bisect_right(self, sprite.depth, key=get_sprite_depth), sprite)
+
+    def remove(self, sprite: Sprite) -> None:
+        del self[self.index(sprite)]
+
+    def move(self, sprite: Sprite, depth: tuple[int, int]) -> None:
+        del self[self.index(sprite)]
+        self.insert(bisect_right(self, depth, key=get_sprite_depth), sprite)
 
 
 class Tile:
+    __slots__ = "is_new", "sprites", "tile_map", "position", "requires_render", "requires_update"
+
     is_new: bool
-    sprites: deque[Sprite]
+    sprites: DepthList
+    tile_map: TileMap
     position: tuple[int, int]
     requires_render: bool
     requires_update: bool
 
-    def __init__(self, position: tuple[int, int]) -> None:
+    def __init__(self, tile_map: TileMap, position: tuple[int, int]) -> None:
         self.is_new = True
-        self.sprites = deque()
+        self.sprites = DepthList()
+        self.tile_map = tile_map
         self.position = position
         self.requires_render = True
         self.requires_update = True
 
-    def _sort_key(self, sprite: Sprite) -> int:
-        return sprite.position[1]
+        tile_map.add_dirty_tile(position)
+        tile_map.updated_tiles.add(position)
 
     def update(self) -> bool:
-        if self.requires_update:
-            self.sprites = deque(sorted(self.sprites, key=self._sort_key))
-            self.requires_update = False
+        self.requires_update = False
 
         return bool(self.sprites)
 
     def add_sprite(self, sprite: Sprite) -> None:
         sprite.tiles.append(self.position)
-        self.sprites.append(sprite)
-        self.requires_update = True
-        self.requires_render = True
+        self.sprites.add(sprite)
+        self.set_requires_update()
+
+    def move_sprite(self, sprite: Sprite, depth: tuple[int, int]) -> None:
+        self.sprites.move(sprite, depth)
+        self.set_requires_render()
 
     def remove_sprite(self, sprite: Sprite) -> None:
         sprite.tiles.remove(self.position)
         self.sprites.remove(sprite)
-        self.requires_update = True
+        self.set_requires_update()
+
+    def set_requires_render(self) -> None:
         self.requires_render = True
+        self.tile_map.add_dirty_tile(self.position)
+
+    def set_requires_update(self) -> None:
+        self.requires_update = True
+        self.tile_map.updated_tiles.add(self.position)
+        self.set_requires_render()
 
 
 class Sprite:
+    __slots__ = (
+        "size", "image", "tiles", "depth", "is_alive", "sprite_id", "render_position",
+        "requires_render", "required_tiles_update", "_required_image_update", "_required_tiles_update",
+        "_flip_x", "_flip_y", "_position", "_rotation", "_texture_name"
+    )
+
     size: tuple[int, int]
-    image: Surface
+    image: AtlasTexture
 
-    tiles: deque[tuple[int, int]]
+    tiles: list[tuple[int, int]]
+    depth: tuple[int, int]
     is_alive: bool
+    sprite_id: int
     render_position: tuple[int, int]
 
     requires_render: bool
@@ -71,6 +130,8 @@ class Sprite:
     _rotation: int
     _texture_name: str
 
+    _sprite_ids: ClassVar[Iterator[int]] = count()
+
     def __init__(
         self, 
         texture_name: str, 
@@ -79,8 +140,9 @@ class Sprite:
         flip_x: bool = False,
         flip_y: bool = False,
     ) -> None:
-        self.tiles = deque()
+        self.tiles = []
         self.is_alive = True
+        self.sprite_id = next(self._sprite_ids)
 
         self._required_image_update = True
         self._required_tiles_update = True
@@ -91,8 +153,12 @@ class Sprite:
         self._rotation = rotation
         self._texture_name = texture_name
         
+        self.depth = self.get_depth()
         self.update()
 
+    def get_depth(self) -> tuple[int, int]:
+        return self._position[1], self.sprite_id
+
     def update(self) -> bool:
         if self._required_image_update:
             textures = ResourcesManager.get_instance()
@@ -179,6 +245,8 @@ class Sprite:
 
 
 class AnimatedSprite(Sprite):
+    __slots__ = "frame_i", "frame_rate", "frame_index", "animation", "_animation_name"
+
     frame_i: int
     frame_rate: int
     frame_index: int
@@ -229,16 +297,180 @@ class AnimatedSprite(Sprite):
         self._animation_name = animation_name
 
 
+class SpritePool:
+    capacity: int
+    free_indices: list[int]
+
+    sizes: np.ndarray
+    covered: np.ndarray
+    positions: np.ndarray
+    image_sizes: np.ndarray
+    render_positions: np.ndarray
+
+    def __init__(self, capacity: int = 1024) -> None:
+        if np is None:
+            raise ImportError("SpritePool requires numpy")
+
+        self.capacity = 0
+        self.free_indices = []
+
+        self.sizes = np.zeros((0, 2), np.int64)
+        self.covered = np.zeros((0, 4), np.int64)
+        self.positions = np.zeros((0, 2), np.float64)
+        self.image_sizes = np.zeros((0, 2), np.int64)
+        self.render_positions = np.zeros((0, 2), np.int64)
+
+        self.resize(capacity)
+
+    def resize(self, capacity: int) -> None:
+        for name in ("sizes", "covered", "positions", "image_sizes", "render_positions"):
+            array = getattr(self, name)
+            resized = np.zeros((capacity, array.shape[1]), array.dtype)
+            resized[:self.capacity] = array
+
+            setattr(self, name, resized)
+
+        self.free_indices.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+
+    def allocate(self) -> int:
+        if not self.free_indices:
+            self.resize(self.capacity * 2)
+
+        index = self.free_indices.pop()
+        self.covered[index] = 0
+
+        return index
+
+    def release(self, index: int) -> None:
+        self.free_indices.append(index)
+
+    def update_covered_tiles(
+        self, indices: np.ndarray, tile_size: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        x, y = self.render_positions[indices].T
+        w, h = self.image_sizes[indices].T
+
+        covered = np.stack((
+            x // tile_size,
+            y // tile_size,
+            -(-(x + w) // tile_size),
+            -(-(y + h) // tile_size)
+        ), axis=1)
+        previous = self.covered[indices]
+        changed = np.flatnonzero((covered != previous).any(axis=1))
+
+        self.covered[indices] = covered
+
+        return changed, previous[changed], covered[changed]
+
+
+class PooledSprite(Sprite):
+    __slots__ = "pool", "index", "_image", "_render_position"
+
+    pool: SpritePool
+    index: int
+
+    _image: AtlasTexture
+    _render_position: tuple[int, int]
+
+    def __init__(
+        self,
+        pool: SpritePool,
+        texture_name: str,
+        position: tuple[int, int] = (0, 0),
+        rotation: float = 0.0,
+        flip_x: bool = False,
+        flip_y: bool = False,
+    ) -> None:
+        self.pool = pool
+        self.index = pool.allocate()
+
+        super().__init__(texture_name, position, rotation, flip_x, flip_y)
+
+    def __del__(self) -> None:
+        self.pool.release(self.index)
+
+    @property
+    def _position(self) -> tuple[int, int]:
+        return to_position(self.pool.positions[self.index].tolist())
+
+    @_position.setter
+    def _position(self, position: tuple[int, int]) -> None:
+        self.pool.positions[self.index] = position
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return tuple(self.pool.sizes[self.index].tolist())
+
+    @size.setter
+    def size(self, size: tuple[int, int]) -> None:
+        self.pool.sizes[self.index] = size
+
+    @property
+    def image(self) -> AtlasTexture:
+        return self._image
+
+    @image.setter
+    def image(self, image: AtlasTexture) -> None:
+        self._image = image
+        self.pool.image_sizes[self.index] = image.get_size()
+
+    @property
+    def render_position(self) -> tuple[int, int]:
+        return self._render_position
+
+    @render_position.setter
+    def render_position(self, render_position: tuple[int, int]) -> None:
+        self._render_position = render_position
+        self.pool.render_positions[self.index] = render_position
+
+
+class SpriteGroup:
+    sprites: list[Sprite]
+    texture_names: list[str]
+
+    positions: np.ndarray
+    rotations: np.ndarray
+    textures: np.ndarray
+
+    def __init__(self, sprites: Iterable[Sprite], texture_names: Optional[list[str]] = None) -> None:
+        if np is None:
+            raise ImportError("SpriteGroup requires numpy")
+
+        self.sprites = list(sprites)
+        self.texture_names = sorted({
+            sprite.texture_name
+            for sprite in self.sprites
+        }) if texture_names is None else texture_names
+
+        texture_indices = {
+            texture_name: i
+            for i, texture_name in enumerate(self.texture_names)
+        }
+
+        self.positions = np.array([sprite.position for sprite in self.sprites], np.float64).reshape(-1, 2)
+        self.rotations = np.array([sprite.rotation for sprite in self.sprites], np.int64)
+        self.textures = np.array([texture_indices[sprite.texture_name] for sprite in self.sprites], np.int64)
+
+
 class TileMap:
     tiles: dict[tuple[int, int], Tile]
     tile_size: int
+    dirty_tiles: set[tuple[int, int]]
+    updated_tiles: set[tuple[int, int]]
     
     def __init__(self, tile_size: int) -> None:
         self.tiles = {}
         self.tile_size = tile_size
+        self.dirty_tiles = set()
+        self.updated_tiles = set()
+
+    def add_dirty_tile(self, position: tuple[int, int]) -> None:
+        self.dirty_tiles.add(position)
 
     def create_tile(self, position: tuple[int, int]) -> Tile:
-        return Tile(position)
+        return Tile(self, position)
 
     def get_covered_tiles(self, sprite: Sprite) -> set[tuple[int, int]]:
         w, h = sprite.image.get_size()
@@ -256,8 +488,57 @@ class TileMap:
             for ty in range(min_y, max_y)
         }
 
+    def get_tiles_in_range(self, covered: list[int]) -> set[tuple[int, int]]:
+        min_x, min_y, max_x, max_y = covered
+
+        return {
+            (tx, ty)
+            for tx in range(min_x, max_x)
+            for ty in range(min_y, max_y)
+        }
+
+    def update_pooled_sprites(self, pool: SpritePool, sprites: list[PooledSprite]) -> None:
+        indices = np.fromiter((sprite.index for sprite in sprites), np.intp, len(sprites))
+        changed, previous, covered = pool.update_covered_tiles(indices, self.tile_size)
+
+        for i, previous_range, covered_range in zip(
+            changed.tolist(), previous.tolist(), covered.tolist()
+        ):
+            sprite = sprites[i]
+            tiles = self.get_tiles_in_range(previous_range)
+            covered_tiles = self.get_tiles_in_range(covered_range)
+
+            for position in covered_tiles - tiles:
+                if (tile := self.tiles.get(position)) is None:
+                    self.tiles[position] = tile = self.create_tile(position)
+
+                tile.add_sprite(sprite)
+
+            for position in tiles - covered_tiles:
+                self.tiles[position].remove_sprite(sprite)
+
+    def update_sprite_depth(self, sprite: Sprite) -> None:
+        depth = sprite.get_depth()
+
+        if depth == sprite.depth:
+            return
+
+        for position in sprite.tiles:
+            self.tiles[position].move_sprite(sprite, depth)
+
+        sprite.depth = depth
+
     def add_sprites(self, sprites: Iterable[Sprite]) -> None:
+        pooled_sprites: dict[SpritePool, list[PooledSprite]] = {}
+
         for sprite in sprites:
+            self.update_sprite_depth(sprite)
+
+            if isinstance(sprite, PooledSprite):
+                pooled_sprites.setdefault(sprite.pool, []).append(sprite)
+
+                continue
+
             covered_tiles = self.get_covered_tiles(sprite)
 
             self.tiles |= {
@@ -270,16 +551,35 @@ class TileMap:
                 tile = self.tiles[position]
                 tile.add_sprite(sprite)
 
+        for pool, pool_sprites in pooled_sprites.items():
+            self.update_pooled_sprites(pool, pool_sprites)
+
     def update_sprites(self, sprites: Iterable[Sprite]) -> None:
+        pooled_sprites: dict[SpritePool, list[PooledSprite]] = {}
+
         for sprite in sprites:
             sprite.requires_render = False
 
+            if isinstance(sprite, PooledSprite):
+                for position in sprite.tiles:
+                    self.tiles[position].set_requires_render()
+
+                if sprite.required_tiles_update:
+                    sprite.required_tiles_update = False
+                    self.update_sprite_depth(sprite)
+                    pooled_sprites.setdefault(sprite.pool, []).append(sprite)
+
+                continue
+
             tiles = set(sprite.tiles)
+            covered_tiles = tiles
 
             if sprite.required_tiles_update:
                 covered_tiles = self.get_covered_tiles(sprite)
                 sprite.required_tiles_update = False
 
+                self.update_sprite_depth(sprite)
+
                 self.tiles |= {
                     position: self.create_tile(position)
                     for position in covered_tiles
@@ -295,34 +595,140 @@ class TileMap:
 
             for position in tiles:
                 tile = self.tiles[position]
-                tile.requires_render = True
+                tile.set_requires_render()
 
                 if position in covered_tiles:
                     continue
 
                 tile.remove_sprite(sprite)
 
+        for pool, pool_sprites in pooled_sprites.items():
+            self.update_pooled_sprites(pool, pool_sprites)
+
+    def transform_sprites(
+        self,
+        group: SpriteGroup,
+        positions: Optional[np.ndarray] = None,
+        rotations: Optional[np.ndarray] = None,
+        textures: Optional[np.ndarray] = None
+    ) -> None:
+        moved = np.zeros(len(group.sprites), bool)
+        retextured = np.zeros(len(group.sprites), bool)
+
+        if positions is not None:
+            positions = np.asarray(positions, np.float64)
+            moved = (positions != group.positions).any(axis=1)
+            group.positions[moved] = positions[moved]
+
+        for values, current in ((rotations, group.rotations), (textures, group.textures)):
+            if values is None:
+                continue
+
+            values = np.asarray(values, current.dtype)
+            changed = values != current
+            current[changed] = values[changed]
+            retextured |= changed
+
+        indices = np.flatnonzero(moved | retextured)
+
+        if not len(indices):
+            return
+
+        resources = ResourcesManager.get_instance()
+        images: dict[tuple[str, float, bool, bool], tuple[tuple[int, int], AtlasTexture]] = {}
+        sprites: list[Sprite] = []
+
+        for i, sprite_moved, sprite_retextured, position, rotation, texture in zip(
+            indices.tolist(),
+            moved[indices].tolist(),
+            retextured[indices].tolist(),
+            group.positions[indices].tolist(),
+            group.rotations[indices].tolist(),
+            group.textures[indices].tolist()
+        ):
+            sprite = group.sprites[i]
+
+            if not sprite.is_alive:
+                continue
+
+            if sprite_moved:
+                sprite._position = x, y = to_position(position)
+            else:
+                x, y = sprite._position
+
+            if sprite_retextured:
+                data = group.texture_names[texture], rotation, sprite._flip_x, sprite._flip_y
+
+                if (image := images.get(data)) is None:
+                    images[data] = image = resources.get_texture(*data)
+
+                sprite._texture_name = data[0]
+                sprite._rotation = rotation
+                sprite.size, sprite.image = image
+                sprite._required_image_update = False
+
+            rw, rh = sprite.image.get_size()
+
+            sprite.render_position = int(x - rw / 2), int(y - rh / 2 - sprite.size[1] / 2)
+            sprite.requires_render = True
+            sprite.required_tiles_update = True
+            sprite._required_tiles_update = False
+
+            if sprite.tiles:
+                sprites.append(sprite)
+
+        self.update_sprites(sprites)
+
     def remove_sprites(self, sprites: Iterable[Sprite]) -> None:
         for sprite in sprites:
             for position in list(sprite.tiles):
                 tile = self.tiles[position]
                 tile.remove_sprite(sprite)
 
+            if isinstance(sprite, PooledSprite):
+                sprite.pool.covered[sprite.index] = 0
+
     def update_tiles(self) -> None:
-        self.tiles = {
-            position: tile
+        for position in self.updated_tiles:
+            if (tile := self.tiles.get(position)) is None or tile.update():
+                continue
+
+            del self.tiles[position]
+
+        self.updated_tiles.clear()
+
+    def get_memory_stats(self) -> dict[str, int]:
+        sprites = {
+            sprite.sprite_id: sprite
+            for tile in self.tiles.values()
+            for sprite in tile.sprites
+        }
+
+        tile_bytes = getsizeof(self.tiles) + sum(
+            getsizeof(tile) + getsizeof(tile.sprites) + getsizeof(position)
             for position, tile in self.tiles.items()
-            if tile.update()
+        )
+        sprite_bytes = sum(
+            getsizeof(sprite) + getsizeof(sprite.tiles) + getsizeof(sprite.depth) + getsizeof(sprite.render_position)
+            for sprite in sprites.values()
+        )
+
+        return {
+            "tiles": len(self.tiles),
+            "tile_bytes": tile_bytes,
+            "sprites": len(sprites),
+            "sprite_bytes": sprite_bytes,
+            "bytes": tile_bytes + sprite_bytes
         }
 
 
 class TSTileMap(TileMap):
-    lock: Lock
+    lock: RLock
 
     def __init__(self, tile_size: int) -> None:
         super().__init__(tile_size)
 
-        self.lock = Lock()
+        self.lock = RLock()
 
     def add_sprites(self, sprites: Iterable[Sprite]) -> None:
         with self.lock:
@@ -332,6 +738,16 @@ class TSTileMap(TileMap):
         with self.lock:
             return super().update_sprites(sprites)
 
+    def transform_sprites(
+        self,
+        group: SpriteGroup,
+        positions: Optional[np.ndarray] = None,
+        rotations: Optional[np.ndarray] = None,
+        textures: Optional[np.ndarray] = None
+    ) -> None:
+        with self.lock:
+            super().transform_sprites(group, positions, rotations, textures)
+
     def remove_sprites(self, sprites: Iterable[Sprite]) -> None:
         with self.lock:
             return super().remove_sprites(sprites)
@@ -341,9 +757,50 @@ class TSTileMap(TileMap):
             super().update_tiles()
 
 
+class ChunkSurfacePool:
+    size: tuple[int, int]
+    surfaces: deque[Surface]
+    max_surfaces: int
+
+    hits: int
+    misses: int
+
+    def __init__(self, size: tuple[int, int], max_surfaces: int = 32) -> None:
+        self.size = size
+        self.surfaces = deque()
+        self.max_surfaces = max_surfaces
+
+        self.hits = 0
+        self.misses = 0
+
+    def acquire(self) -> Surface:
+        if not self.surfaces:
+            self.misses += 1
+
+            return Surface(self.size)
+
+        self.hits += 1
+
+        surface = self.surfaces.pop()
+        surface.fill((0, 0, 0))
+
+        return surface
+
+    def release(self, surface: Surface) -> None:
+        if len(self.surfaces) < self.max_surfaces:
+            self.surfaces.append(surface)
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "free": len(self.surfaces)
+        }
+
+
 class Chunk:
     tiles: int
-    image: Surface
+    image: Optional[Surface]
     tile_map: ChunkedTileMap
     position: tuple[int, int]
     background: Surface
@@ -351,64 +808,80 @@ class Chunk:
 
     def __init__(self, tile_map: ChunkedTileMap, position: tuple[int, int]) -> None:
         self.tiles = 1
-        self.image = Surface((
-            tile_map.chunk_size * tile_map.tile_size, 
-            tile_map.chunk_size * tile_map.tile_size
-        ))
+        self.image = None if tile_map.max_chunk_bytes is not None else tile_map.chunk_surfaces.acquire()
         self.tile_map = tile_map
         self.position = position
-        self.background = Surface((tile_map.tile_size, tile_map.tile_size))
+        self.background = tile_map.background
         self.render_position = (
             position[0] * tile_map.tile_size * tile_map.chunk_size, 
             position[1] * tile_map.tile_size * tile_map.chunk_size
         )
 
-    def draw_tiles(self, tiles: deque[ChunkedTile]) -> None:
-        self.image.blits((
-            render_data
-            for tile in tiles
-            for render_data in self.get_render_data(tile)
-        ), 0)
+    def get_rect(self) -> Rect:
+        size = self.tile_map.chunk_size * self.tile_map.tile_size
+
+        return Rect(self.render_position, (size, size))
+
+    def draw_tiles(self, positions: deque[tuple[int, int]]) -> Rect:
+        tile_size = self.tile_map.tile_size
+        rx, ry = self.render_position
+
+        min_x = min(position[0] for position in positions)
+        min_y = min(position[1] for position in positions)
+        max_x = max(position[0] for position in positions) + 1
+        max_y = max(position[1] for position in positions) + 1
+
+        rect = Rect(
+            min_x * tile_size, 
+            min_y * tile_size, 
+            (max_x - min_x) * tile_size, 
+            (max_y - min_y) * tile_size
+        )
+
+        self.image.set_clip(rect.move(-rx, -ry))
+        self.image.blits(self.get_render_data(min_x, min_y, max_x, max_y), 0)
+        self.image.set_clip(None)
+
+        return rect
 
     def get_render_data(
-        self, tile: Tile
+        self, min_x: int, min_y: int, max_x: int, max_y: int
     ) -> Generator[
         Union[
             tuple[Surface, tuple[int, int]],
-            tuple[Surface, tuple[int, int], tuple[int, int, int, int]]
+            tuple[Surface, tuple[int, int], Rect]
         ],
         None, 
         None
     ]:
-        x, y = tile.position
-        arx, ary = x * self.tile_map.tile_size, y * self.tile_map.tile_size
-        relative_render_position = (
-            x % self.tile_map.chunk_size * self.tile_map.tile_size, 
-            y % self.tile_map.chunk_size * self.tile_map.tile_size
-        )
+        tiles = self.tile_map.tiles
+        tile_size = self.tile_map.tile_size
+        crx, cry = self.render_position
+        sprites: set[Sprite] = set()
 
-        return chain(
-            ((self.background, relative_render_position), ),
-            (
-                (
-                    sprite.image,
-                    relative_render_position,
-                    (
-                        arx - sprite.render_position[0],
-                        ary - sprite.render_position[1],
-                        self.tile_map.tile_size, self.tile_map.tile_size
-                    )
-                )
-                for sprite in tile.sprites
-            )
-        )
+        for x in range(min_x, max_x):
+            for y in range(min_y, max_y):
+                yield self.background, (x * tile_size - crx, y * tile_size - cry)
+
+                if (tile := tiles.get((x, y))) is not None:
+                    sprites.update(tile.sprites)
+
+        for sprite in sorted(sprites, key=attrgetter("depth")):
+            atlas, rect = sprite.image
+            rx, ry = sprite.render_position
+
+            yield atlas, (rx - crx, ry - cry), rect
 
 
 class ChunkedTile(Tile):
+    __slots__ = "chunk",
+
     chunk: Optional[Chunk]
 
-    def __init__(self, position: tuple[int, int], chunk: Optional[Chunk] = None) -> None:
-        super().__init__(position)
+    def __init__(
+        self, tile_map: ChunkedTileMap, position: tuple[int, int], chunk: Optional[Chunk] = None
+    ) -> None:
+        super().__init__(tile_map, position)
 
         self.chunk = chunk
 
@@ -420,12 +893,45 @@ class ChunkedTileMap(TileMap):
     tiles: dict[tuple[int, int], ChunkedTile]
     chunks: dict[tuple[int, int], Chunk]
     chunk_size: int
+    background: Surface
+    chunk_images: OrderedDict[tuple[int, int], Chunk]
+    dirty_chunks: dict[tuple[int, int], set[tuple[int, int]]]
+    redrawn_rects: list[Rect]
+    chunk_surfaces: ChunkSurfacePool
+    max_chunk_bytes: Optional[int]
+    chunk_image_bytes: int
+    executor: Optional[ThreadPoolExecutor]
 
-    def __init__(self, tile_size: int = 16, chunk_size: int = 8):
+    def __init__(
+        self, 
+        tile_size: int = 16, 
+        chunk_size: int = 8, 
+        max_pooled_chunks: int = 32,
+        max_chunk_bytes: Optional[int] = None,
+        rasterize_workers: int = 0
+    ):
         super().__init__(tile_size)
 
         self.chunks = {}
         self.chunk_size = chunk_size
+        self.background = Surface((tile_size, tile_size))
+        self.chunk_images = OrderedDict()
+        self.dirty_chunks = {}
+        self.redrawn_rects = []
+        self.chunk_surfaces = ChunkSurfacePool(
+            (chunk_size * tile_size, chunk_size * tile_size), max_pooled_chunks
+        )
+        self.max_chunk_bytes = max_chunk_bytes
+        self.chunk_image_bytes = (chunk_size * tile_size) ** 2 * self.background.get_bytesize()
+        self.executor = ThreadPoolExecutor(rasterize_workers) if rasterize_workers else None
+
+    def add_dirty_tile(self, position: tuple[int, int]) -> None:
+        chunk_position = position[0] // self.chunk_size, position[1] // self.chunk_size
+
+        if (positions := self.dirty_chunks.get(chunk_position)) is None:
+            self.dirty_chunks[chunk_position] = positions = set()
+
+        positions.add(position)
 
     def create_tile(self, position: tuple[int, int]) -> ChunkedTile:
         chunk_position = position[0] // self.chunk_size, position[1] // self.chunk_size
@@ -435,21 +941,79 @@ class ChunkedTileMap(TileMap):
         else:
             chunk = self.create_chunk(chunk_position)
 
-        return ChunkedTile(position, chunk)
+        return ChunkedTile(self, position, chunk)
 
     def create_chunk(self, position: tuple[int, int]) -> Chunk:
         chunk = Chunk(self, position)
         
         self.chunks[position] = chunk
+
+        if chunk.image is not None:
+            self.chunk_images[position] = chunk
         
         return chunk
 
+    def get_chunk_positions(self, chunk: Chunk) -> Generator[tuple[int, int], None, None]:
+        cx, cy = chunk.position
+
+        for x in range(cx * self.chunk_size, (cx + 1) * self.chunk_size):
+            for y in range(cy * self.chunk_size, (cy + 1) * self.chunk_size):
+                yield x, y
+
+    def get_chunk_tiles(self, chunk: Chunk) -> Generator[ChunkedTile, None, None]:
+        for position in self.get_chunk_positions(chunk):
+            if (tile := self.tiles.get(position)) is not None:
+                yield tile
+
+    def load_chunk(self, chunk: Chunk) -> deque[tuple[int, int]]:
+        positions = deque()
+
+        for tile in self.get_chunk_tiles(chunk):
+            tile.requires_render = False
+            positions.append(tile.position)
+
+        self.dirty_chunks.pop(chunk.position, None)
+
+        chunk.image = self.chunk_surfaces.acquire()
+        self.chunk_images[chunk.position] = chunk
+
+        return positions
+
+    def unload_chunk(self, chunk: Chunk) -> None:
+        del self.chunk_images[chunk.position]
+
+        self.chunk_surfaces.release(chunk.image)
+        chunk.image = None
+
+    def evict_chunks(self, visible_chunks: set[tuple[int, int]]) -> None:
+        if self.max_chunk_bytes is None:
+            return
+
+        while len(self.chunk_images) * self.chunk_image_bytes > self.max_chunk_bytes:
+            position, chunk = next(iter(self.chunk_images.items()))
+
+            if position in visible_chunks:
+                break
+
+            self.unload_chunk(chunk)
+
     def update(self, size: tuple[int, int], offset: tuple[int, int]) -> None:        
         self.update_tiles(size, offset)        
         self.update_chunks()
 
     def update_tiles(self, size: tuple[int, int], offset: tuple[int, int]) -> None:
-        update_chunks: dict[tuple[int, int], deque[ChunkedTile]] = {}
+        self.redrawn_rects = []
+
+        visible_chunks: set[tuple[int, int]] = set()
+        update_chunks: dict[tuple[int, int], deque[tuple[int, int]]] = {}
+
+        for chunk in self.get_visible_chunks(size, offset):
+            visible_chunks.add(chunk.position)
+
+            if chunk.image is None:
+                update_chunks[chunk.position] = self.load_chunk(chunk)
+            else:
+                self.chunk_images.move_to_end(chunk.position)
 
         rect = Rect(
             offset[0] - self.tile_size, 
@@ -458,33 +1022,119 @@ class ChunkedTileMap(TileMap):
             size[1] + self.tile_size * 2
         )
 
-        for (x, y), tile in self.tiles.items():
-            if not tile.requires_render:
+        for chunk_position in self.get_chunk_positions_in_rect(rect):
+            if (dirty_positions := self.dirty_chunks.get(chunk_position)) is None:
                 continue
 
-            if not rect.contains(x * 16, y * 16, self.tile_size, self.tile_size):
+            if chunk_position not in self.chunks:
+                del self.dirty_chunks[chunk_position]
+
                 continue
 
-            tile.requires_render = False
-            
-            chunk_position = tile.chunk.position
+            positions = deque(
+                position
+                for position in dirty_positions
+                if rect.contains(
+                    position[0] * self.tile_size, position[1] * self.tile_size, self.tile_size, self.tile_size
+                )
+            )
+
+            if not positions:
+                continue
+
+            dirty_positions.difference_update(positions)
+
+            if not dirty_positions:
+                del self.dirty_chunks[chunk_position]
+
+            for position in positions:
+                if (tile := self.tiles.get(position)) is not None:
+                    tile.requires_render = False
 
             if (tiles := update_chunks.get(chunk_position)) is None:
-                update_chunks[chunk_position] = tiles = deque()
+                update_chunks[chunk_position] = positions
+            else:
+                tiles.extend(positions)
+
+        chunks: deque[tuple[Chunk, deque[tuple[int, int]]]] = deque()
+
+        for position, positions in update_chunks.items():
+            chunk = self.chunks[position]
+
+            if chunk.image is None:
+                positions = self.load_chunk(chunk)
 
-            tiles.append(tile)
+            if positions:
+                chunks.append((chunk, positions))
 
-        for position, tiles in update_chunks.items():
-            self.chunks[position].draw_tiles(tiles)
+        self.draw_chunks(chunks)
+        self.evict_chunks(visible_chunks)
 
         super().update_tiles()
 
+    def draw_chunks(self, chunks: Iterable[tuple[Chunk, deque[tuple[int, int]]]]) -> None:
+        if self.executor is None:
+            self.redrawn_rects.extend(
+                chunk.draw_tiles(positions)
+                for chunk, positions in chunks
+            )
+
+            return
+
+        for future in [
+            self.executor.submit(chunk.draw_tiles, positions)
+            for chunk, positions in chunks
+        ]:
+            self.redrawn_rects.append(future.result())
+
+    def get_chunk_positions_in_rect(self, rect: Rect) -> Generator[tuple[int, int], None, None]:
+        chunk_size = self.chunk_size * self.tile_size
+
+        for x in range(rect.left // chunk_size, ceil(rect.right / chunk_size)):
+            for y in range(rect.top // chunk_size, ceil(rect.bottom / chunk_size)):
+                yield x, y
+
+    def get_visible_chunks(
+        self, size: tuple[int, int], offset: tuple[int, int]
+    ) -> Generator[Chunk, None, None]:
+        chunk_size = self.chunk_size * self.tile_size
+
+        min_x = int(offset[0] // chunk_size)
+        min_y = int(offset[1] // chunk_size)
+
+        max_x = ceil((offset[0] + size[0]) / chunk_size)
+        max_y = ceil((offset[1] + size[1]) / chunk_size)
+
+        for x in range(min_x, max_x):
+            for y in range(min_y, max_y):
+                if (chunk := self.chunks.get((x, y))) is not None:
+                    yield chunk
+
     def update_chunks(self) -> None:
-        self.chunks = {
-            position: chunk
-            for position, chunk in self.chunks.items()
-            if chunk.tiles
-        }
+        for position, chunk in list(self.chunks.items()):
+            if chunk.tiles:
+                continue
+
+            del self.chunks[position]
+            self.dirty_chunks.pop(position, None)
+            self.redrawn_rects.append(chunk.get_rect())
+
+            if chunk.image is not None:
+                self.unload_chunk(chunk)
+
+    def get_memory_stats(self) -> dict[str, int]:
+        stats = super().get_memory_stats()
+        chunk_bytes = getsizeof(self.chunks) + sum(
+            getsizeof(chunk) + getsizeof(vars(chunk))
+            for chunk in self.chunks.values()
+        )
+
+        stats["chunks"] = len(self.chunks)
+        stats["chunk_bytes"] = chunk_bytes
+        stats["chunk_image_bytes"] = len(self.chunk_images) * self.chunk_image_bytes
+        stats["bytes"] += chunk_bytes + stats["chunk_image_bytes"]
+
+        return stats
 
 
 class TSChunkedTileMap(ChunkedTileMap, TSTileMap):
@@ -497,6 +1147,11 @@ class TileMapNode(DrawableNode):
     offset: tuple[int, int]
     sprites: deque[Sprite]
     tile_map: TSChunkedTileMap
+    dynamic_sprites: list[Sprite]
+
+    max_dirty_rects: int
+    dynamic_rects: list[Rect]
+    previous_offset: Optional[tuple[int, int]]
 
     def __init__(self) -> None:
         super().__init__()
@@ -505,6 +1160,11 @@ class TileMapNode(DrawableNode):
         self.offset = 0, 0
         self.sprites = deque()
         self.tile_map = TSChunkedTileMap()
+        self.dynamic_sprites = []
+
+        self.max_dirty_rects = 32
+        self.dynamic_rects = []
+        self.previous_offset = None
 
     def add_sprites(self, sprites: Iterable[Sprite]) -> None:
         sprites = list(sprites)
@@ -512,7 +1172,59 @@ class TileMapNode(DrawableNode):
         self.sprites.extend(sprites)
         self.tile_map.add_sprites(sprites)
 
-    def update(self) -> bool:
+    def add_dynamic_sprites(self, sprites: Iterable[Sprite]) -> None:
+        self.dynamic_sprites.extend(sprites)
+
+    def get_occluding_sprites(self, sprite: Sprite, depth: tuple[int, int]) -> set[Sprite]:
+        return {
+            occluder
+            for position in self.tile_map.get_covered_tiles(sprite)
+            if (tile := self.tile_map.tiles.get(position)) is not None
+            for occluder in tile.sprites
+            if occluder.depth > depth
+        }
+
+    def get_dynamic_render_data(
+        self, size: tuple[int, int], offset: tuple[int, int]
+    ) -> Generator[tuple[Surface, tuple[int, int], Rect], None, None]:
+        ox, oy = offset
+        viewport = Rect(ox, oy, size[0], size[1])
+        render_items: list[tuple[tuple[int, int], Sprite, Rect]] = []
+
+        for sprite in self.dynamic_sprites:
+            rect = Rect(sprite.render_position, sprite.image.get_size())
+
+            if not viewport.colliderect(rect):
+                continue
+
+            depth = sprite.get_depth()
+
+            render_items.append((depth, sprite, rect))
+            render_items.extend(
+                (occluder.depth, occluder, rect)
+                for occluder in self.get_occluding_sprites(sprite, depth)
+            )
+
+        render_items.sort(key=itemgetter(0))
+
+        for _, sprite, rect in render_items:
+            atlas, texture_rect = sprite.image
+            rx, ry = sprite.render_position
+            clip = rect.clip(rx, ry, texture_rect.width, texture_rect.height)
+
+            yield (
+                atlas,
+                (clip.x - ox, clip.y - oy),
+                Rect(texture_rect.x + clip.x - rx, texture_rect.y + clip.y - ry, clip.width, clip.height)
+            )
+
+    def update_sprites(self) -> None:
+        self.dynamic_sprites = [
+            sprite
+            for sprite in self.dynamic_sprites
+            if sprite.update()
+        ]
+
         self.tile_map.remove_sprites(
             sprite
             for sprite in self.sprites
@@ -525,26 +1237,94 @@ class TileMapNode(DrawableNode):
             if sprite.is_alive and sprite.requires_render
         )
 
-        self.tile_map.update(self.scene.game.screen.get_size(), self.offset)
-
         self.sprites = [
             sprite
             for sprite in self.sprites
             if sprite.is_alive
         ]
 
-        ox, oy = self.offset
+    def update(self) -> bool:
+        size = self.scene.game.screen.get_size()
+
+        self.update_sprites()
+        self.tile_map.update(size, self.offset)
+        self.draw(size, (int(self.offset[0]), int(self.offset[1])))
+
+        return self.is_alive
+
+    def scroll_image(
+        self, size: tuple[int, int], offset: tuple[int, int], dynamic_rects: list[Rect]
+    ) -> Optional[list[Rect]]:
+        if self.previous_offset is None:
+            return None
+
+        w, h = size
+        ox, oy = offset
+        dx, dy = ox - self.previous_offset[0], oy - self.previous_offset[1]
+
+        if abs(dx) >= w or abs(dy) >= h:
+            return None
+
+        self.image.scroll(-dx, -dy)
+
+        dirty_rects = [
+            rect.move(-ox, -oy)
+            for rect in chain(self.tile_map.redrawn_rects, self.dynamic_rects, dynamic_rects)
+        ]
+
+        if dx > 0:
+            dirty_rects.append(Rect(w - dx, 0, dx, h))
+        elif dx < 0:
+            dirty_rects.append(Rect(0, 0, -dx, h))
+
+        if dy > 0:
+            dirty_rects.append(Rect(0, h - dy, w, dy))
+        elif dy < 0:
+            dirty_rects.append(Rect(0, 0, w, -dy))
+
+        return dirty_rects
+
+    def draw(self, size: tuple[int, int], offset: tuple[int, int]) -> None:
+        ox, oy = offset
+        screen_rect = Rect((0, 0), size)
+        dynamic_rects = [
+            Rect(sprite.render_position, sprite.image.get_size())
+            for sprite in self.dynamic_sprites
+        ]
+
+        dirty_rects = self.scroll_image(size, offset, dynamic_rects)
+
+        if dirty_rects is None:
+            dirty_rects = [screen_rect]
+        elif len(dirty_rects) > self.max_dirty_rects:
+            dirty_rects = [dirty_rects[0].unionall(dirty_rects[1:])]
+
+        dynamic_render_data = None
 
-        self.image.fill((0, 0, 0))
-        self.image.fblits(
-            (
-                chunk.image,
+        for rect in dirty_rects:
+            rect = rect.clip(screen_rect)
+
+            if not rect:
+                continue
+
+            if dynamic_render_data is None:
+                dynamic_render_data = list(self.get_dynamic_render_data(size, offset))
+
+            self.image.set_clip(rect)
+            self.image.fill((0, 0, 0))
+            self.image.fblits(
                 (
-                    chunk.render_position[0] - ox,
-                    chunk.render_position[1] - oy
+                    chunk.image,
+                    (
+                        chunk.render_position[0] - ox,
+                        chunk.render_position[1] - oy
+                    )
                 )
+                for chunk in self.tile_map.get_visible_chunks(rect.size, (ox + rect.x, oy + rect.y))
             )
-            for chunk in self.tile_map.chunks.values()
-        )
+            self.image.blits(dynamic_render_data, 0)
 
-        return self.is_alive
+        self.image.set_clip(None)
+
+        self.dynamic_rects = dynamic_rects
+        self.previous_offset = offset